@@ -0,0 +1,68 @@
+"""
+Batch chord fingerprinting for the heuristic classifier.
+
+Compiled with Numba when it is installed, otherwise runs as plain Python
+over NumPy arrays.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the loop still runs uncompiled
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def heuristic_fingerprints(chords):
+    """
+    Compute heuristic chord fingerprints for a padded array of chords.
+
+    Args:
+        chords: Integer array of shape (num_chords, max_notes) holding MIDI
+                note numbers, padded with -1. All-padding rows are rests.
+                Values outside 0-127 are skipped like padding.
+
+    Returns:
+        int32 array with one fingerprint per chord: the root-relative
+        pitch-class mask in bits 0-11, the bass pitch class in bits 12-15
+        and the unique note count from bit 16. Rests are 0.
+    """
+    num_chords, max_notes = chords.shape
+    fingerprints = np.zeros(num_chords, dtype=np.int32)
+    seen = np.zeros(128, dtype=np.uint8)
+
+    for i in range(num_chords):
+        bass = 128
+        for j in range(max_notes):
+            note = int(chords[i, j])  # Widen small dtypes such as int8
+            if 0 <= note < bass:
+                bass = note
+        if bass == 128:
+            continue
+
+        pc_mask = 0
+        note_count = 0
+        for j in range(max_notes):
+            note = int(chords[i, j])
+            if not 0 <= note < 128:
+                continue
+            pc_mask |= 1 << ((note - bass) % 12)
+            if not seen[note]:
+                seen[note] = 1
+                note_count += 1
+
+        # Reset only the entries this chord touched
+        for j in range(max_notes):
+            note = int(chords[i, j])
+            if 0 <= note < 128:
+                seen[note] = 0
+
+        fingerprints[i] = pc_mask | ((bass % 12) << 12) | (note_count << 16)
+
+    return fingerprints
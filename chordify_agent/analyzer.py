@@ -5,12 +5,211 @@ Uses music21 for advanced chord analysis with custom heuristic fallbacks
 for robust chord name detection.
 """
 
-from typing import List, Tuple, Dict, Any, Optional
+import sys
+from typing import List, Tuple, Dict, Any, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only needed for batch conversion
+    np = None
+
+# music21 entry points, imported once by _load_music21() on first use
+_m21chord = None
+_chordSymbolFigureFromChord = None
+_music21_checked = False
+
+
+def _load_music21() -> bool:
+    """Import music21 on first call and report whether it is available."""
+    global _m21chord, _chordSymbolFigureFromChord, _music21_checked
+
+    if not _music21_checked:
+        _music21_checked = True
+        try:
+            from music21 import chord as m21chord
+            from music21.harmony import chordSymbolFigureFromChord
+
+            _m21chord = m21chord
+            _chordSymbolFigureFromChord = chordSymbolFigureFromChord
+        except ImportError:
+            pass
+
+    return _m21chord is not None
+
+
+# Analysis results keyed by chord fingerprint:
+# (notes as given if music21 is used else False, pitch-class bitmask,
+#  bass pitch class, unique note count)
+_FINGERPRINT_CACHE: Dict[Tuple[Any, int, int, int], Tuple[str, float, str]] = {}
+_FINGERPRINT_CACHE_SIZE = 4096
+
+# Heuristic confidence indexed by unique note count (7 and above share a bucket)
+_CONFIDENCE_BY_NOTE_COUNT = (0.85, 0.85, 0.85, 0.85, 0.80, 0.70, 0.70, 0.60)
+
+
+def _heuristic_template(pc_mask: int) -> str:
+    """
+    Build a chord name template from a root-relative pitch-class mask.
+
+    Bit ``i`` of ``pc_mask`` is set when the chord contains the pitch class
+    ``i`` semitones above the root (bit 0). The template uses ``{R}`` for the
+    root name and ``{N}`` for the note count, e.g. ``"{R}m7"`` or
+    ``"{R}maj13({N})"``.
+    """
+    # Interval detection
+    has_maj3 = pc_mask & (1 << 4)
+    has_min3 = pc_mask & (1 << 3)
+    has_p5 = pc_mask & (1 << 7)
+    has_dim5 = pc_mask & (1 << 6)
+    has_aug5 = pc_mask & (1 << 8)
+    has_min7 = pc_mask & (1 << 10)
+    has_maj7 = pc_mask & (1 << 11)
+    has_9 = pc_mask & (1 << 2)
+    has_11 = pc_mask & (1 << 5)
+    has_13 = pc_mask & (1 << 9)
+
+    # Build chord name
+    chord_name = "{R}"
+
+    # Determine basic quality
+    if has_min3 and has_dim5:
+        chord_name += "dim"
+    elif has_min3:
+        chord_name += "m"
+    elif has_maj3 and has_aug5:
+        chord_name += "aug"
+    elif has_maj3 and has_p5:
+        pass  # Major, no modifier
+    elif has_maj3 and has_dim5:
+        chord_name += "7"  # Dominant with tritone
+    elif not has_maj3 and not has_min3:
+        # Sus chords
+        if has_11:
+            chord_name += "sus4"
+        elif has_9:
+            chord_name += "sus2"
+
+    # Add 7th extensions
+    if has_maj7:
+        chord_name += "maj7"
+    elif has_min7:
+        chord_name += "7"
+
+    # Add upper extensions
+    extensions = []
+    if has_13:
+        extensions.append("13")
+    elif has_11:
+        extensions.append("11")
+    elif has_9:
+        extensions.append("9")
+
+    if extensions:
+        if chord_name.endswith("7") and not chord_name.endswith("maj7"):
+            chord_name = chord_name[:-1]
+        chord_name += extensions[0]
+
+    # Handle very complex chords (more than five intervals above the root)
+    if bin(pc_mask).count("1") > 6:
+        return chord_name + "({N})"
+
+    return chord_name
+
+
+def _build_common_chords() -> Dict[Tuple[int, int], str]:
+    """Map (pitch-class mask, bass pitch class) to music21-style chord names."""
+    # Intervals above the root for each quality, and the suffix music21 uses
+    qualities = [
+        ((0, 4, 7), ""),
+        ((0, 3, 7), "m"),
+        ((0, 3, 6), "dim"),
+        ((0, 4, 7, 10), "7"),
+        ((0, 4, 7, 11), "maj7"),
+        ((0, 3, 7, 10), "m7"),
+        ((0, 3, 6, 10), "ø7"),
+    ]
+    table = {}
+    for root in range(12):
+        for intervals, suffix in qualities:
+            pc_mask = 0
+            for interval in intervals:
+                pc_mask |= 1 << ((root + interval) % 12)
+            table[(pc_mask, root)] = sys.intern(_M21_ROOT_NAMES[root] + suffix)
+    return table
+
+
+def _build_heuristic_table() -> List[str]:
+    """Precompute name templates for every root-relative pitch-class mask."""
+    table = [""] * 4096
+    for pc_mask in range(1, 4096, 2):  # The root (bit 0) is always present
+        table[pc_mask] = _heuristic_template(pc_mask)
+    return table
+
+
+# Chord name templates indexed by pitch-class mask relative to the root
+_HEURISTIC_TABLE = _build_heuristic_table()
+
+# Pitch class names as music21 spells MIDI notes
+_M21_ROOT_NAMES = ["C", "C#", "D", "E-", "E", "F", "F#", "G", "G#", "A", "B-", "B"]
+
+# Common root-position chords resolved without music21
+_COMMON_CHORDS = _build_common_chords()
+
+
+class ChordResult(NamedTuple):
+    """
+    Analysis of a single chord.
+
+    Fields can also be read by name (``result["chord_name"]``), and
+    ``keys()``, ``items()``, ``get()`` and ``"field" in result`` behave as
+    with the dictionaries earlier versions returned. Iterating still yields
+    values, as for any tuple; ``as_dict()`` converts to a real dictionary.
+    """
+
+    chord_name: str  # e.g. "Cmaj7"
+    notes: List[str]  # e.g. ["C4", "E4", "G4", "B4"]
+    midi_notes: List[int]  # Sorted MIDI numbers
+    note_count: int  # Number of notes
+    confidence: float  # Recognition confidence
+    method: str  # "music21", "lookup", "heuristic" or "builtin"
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = _RESULT_FIELDS[key]
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in _RESULT_FIELDS
+        return tuple.__contains__(self, key)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the field names, like ``dict.keys()``."""
+        return self._fields
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Return (field name, value) pairs, like ``dict.items()``."""
+        return list(zip(self._fields, self))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or ``default`` if there is no such field."""
+        index = _RESULT_FIELDS.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the analysis as a plain dictionary."""
+        return dict(zip(self._fields, self))
+
+
+# Field name -> tuple index, for subscripting ChordResult by name
+_RESULT_FIELDS = {name: index for index, name in enumerate(ChordResult._fields)}
 
 
 class ChordAnalyzer:
     """Analyze MIDI notes and convert to chord names."""
 
+    __slots__ = ("use_music21", "_music21_available", "_analyze_fingerprint")
+
     NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
     def __init__(self, use_music21: bool = True):
@@ -22,25 +221,23 @@ class ChordAnalyzer:
                         Falls back to heuristics if unavailable.
         """
         self.use_music21 = use_music21
-        self._music21_available = False
-
-        if use_music21:
-            try:
-                from music21 import chord as m21chord
-                from music21.harmony import chordSymbolFigureFromChord
+        self._music21_available = use_music21 and _load_music21()
 
-                self._m21chord = m21chord
-                self._chordSymbolFigureFromChord = chordSymbolFigureFromChord
-                self._music21_available = True
-            except ImportError:
-                pass
+        # Pick the resolution path once instead of checking on every chord
+        if self._music21_available:
+            self._analyze_fingerprint = self._analyze_music21
+        else:
+            self._analyze_fingerprint = self._analyze_heuristic
 
-    def midi_to_note_names(self, midi_notes: List[int]) -> List[str]:
+    def midi_to_note_names(
+        self, midi_notes: List[int], is_sorted: bool = False
+    ) -> List[str]:
         """
         Convert MIDI note numbers to readable note names with octaves.
 
         Args:
             midi_notes: List of MIDI note numbers (0-127)
+            is_sorted: Skip sorting when midi_notes is already in ascending order
 
         Returns:
             List of note names with octaves (e.g. ["C4", "E4", "G4"])
@@ -48,17 +245,43 @@ class ChordAnalyzer:
         if not midi_notes:
             return []
 
-        result = []
-        for midi_note in sorted(midi_notes):
-            octave = (midi_note // 12) - 1  # MIDI octave calculation
-            note_name = self.NOTE_NAMES[midi_note % 12]
-            result.append(f"{note_name}{octave}")
+        if not is_sorted:
+            midi_notes = sorted(midi_notes)
 
-        return result
+        # Table lookup for MIDI range, formatting for anything outside it
+        return [
+            _MIDI_NOTE_NAMES[note] if 0 <= note < 128 else _note_name(note)
+            for note in midi_notes
+        ]
+
+    def midi_to_note_names_batch(self, midi_array: "np.ndarray") -> "np.ndarray":
+        """
+        Convert an array of MIDI note numbers to note names with octaves.
+
+        Unlike ``midi_to_note_names`` the input is not sorted, so arrays of
+        any shape (e.g. one row per chord) map element-wise. Requires NumPy.
+
+        Args:
+            midi_array: Array of MIDI note numbers (0-127)
+
+        Returns:
+            Array of note names with the same shape as ``midi_array``
+
+        Raises:
+            ValueError: If any note is outside the MIDI range 0-127
+        """
+        if np is None:
+            raise ImportError("midi_to_note_names_batch requires NumPy")
+
+        midi_array = np.asarray(midi_array)
+        if midi_array.size and (midi_array.min() < 0 or midi_array.max() > 127):
+            raise ValueError("midi_array notes must be MIDI numbers (0-127)")
+
+        return _MIDI_NOTE_NAME_ARR[midi_array]
 
     def analyze_chord(
         self, midi_notes: List[int], confidence_threshold: float = 0.7
-    ) -> Dict[str, Any]:
+    ) -> ChordResult:
         """
         Analyze a chord from MIDI note numbers.
 
@@ -67,60 +290,103 @@ class ChordAnalyzer:
             confidence_threshold: Minimum confidence for chord recognition (0.0-1.0)
 
         Returns:
-            Dictionary with chord analysis:
-            {
-                "chord_name": str,      # e.g. "Cmaj7"
-                "notes": List[str],     # e.g. ["C4", "E4", "G4", "B4"]
-                "midi_notes": List[int],# Original MIDI numbers
-                "note_count": int,      # Number of unique notes
-                "confidence": float,    # Recognition confidence
-                "method": str           # "music21" or "heuristic"
-            }
+            ChordResult with chord analysis:
+                chord_name: str         # e.g. "Cmaj7"
+                notes: List[str]        # e.g. ["C4", "E4", "G4", "B4"]
+                midi_notes: List[int]   # Sorted MIDI numbers
+                note_count: int         # Number of notes
+                confidence: float       # Recognition confidence
+                method: str             # "music21", "lookup" or "heuristic"
         """
         if not midi_notes:
-            return {
-                "chord_name": "Rest",
-                "notes": [],
-                "midi_notes": [],
-                "note_count": 0,
-                "confidence": 1.0,
-                "method": "builtin",
-            }
-
-        # Try music21 first
-        if self._music21_available:
-            try:
-                m21_chord = self._m21chord.Chord(midi_notes)
-                symbol = self._chordSymbolFigureFromChord(m21_chord)
-                if symbol:
-                    # Normalize power chord notation (Cpower → C5)
-                    if symbol.endswith("power"):
-                        symbol = symbol.replace("power", "5")
-                    
-                    return {
-                        "chord_name": symbol,
-                        "notes": self.midi_to_note_names(midi_notes),
-                        "midi_notes": sorted(midi_notes),
-                        "note_count": len(midi_notes),
-                        "confidence": 0.95,
-                        "method": "music21",
-                    }
-            except Exception:
-                # Fall through to heuristic method
-                pass
-
-        # Heuristic fallback
+            return ChordResult("Rest", [], [], 0, 1.0, "builtin")
+
+        # Repeated chords are resolved from the cache. Heuristic names only
+        # depend on the pitch-class fingerprint, but music21's depend on the
+        # voicing (and its spelling on note order), so its results are also
+        # keyed on the notes exactly as given.
+        sorted_notes = sorted(midi_notes)
+        unique_notes = set(sorted_notes)
+        pc_mask = 0
+        for note in unique_notes:
+            pc_mask |= 1 << (note % 12)
+        bass_pc = sorted_notes[0] % 12
+        unique_count = len(unique_notes)
+        key = (
+            self._music21_available and tuple(midi_notes),
+            pc_mask,
+            bass_pc,
+            unique_count,
+        )
+
+        cached = _FINGERPRINT_CACHE.get(key)
+        if cached is None:
+            cached = self._analyze_fingerprint(
+                midi_notes, pc_mask, bass_pc, unique_count
+            )
+            if len(_FINGERPRINT_CACHE) >= _FINGERPRINT_CACHE_SIZE:
+                _FINGERPRINT_CACHE.clear()
+            _FINGERPRINT_CACHE[key] = cached
+
+        chord_name, confidence, method = cached
+        return self._make_result(sorted_notes, chord_name, confidence, method)
+
+    def _make_result(
+        self, sorted_notes: List[int], chord_name: str, confidence: float, method: str
+    ) -> ChordResult:
+        """Assemble the analysis result for a chord's sorted MIDI notes."""
+        return ChordResult(
+            chord_name,
+            self.midi_to_note_names(sorted_notes, is_sorted=True),
+            sorted_notes,
+            len(sorted_notes),
+            confidence,
+            method,
+        )
+
+    def _analyze_music21(
+        self, midi_notes: List[int], pc_mask: int, bass_pc: int, unique_count: int
+    ) -> Tuple[str, float, str]:
+        """
+        Resolve chord name, confidence and method using music21.
+
+        Bound as ``_analyze_fingerprint`` when music21 is available. Results
+        are cached per voicing by ``analyze_chord``, so this only runs once
+        for each distinct set of notes.
+        """
+        # Root-position triads and sevenths don't need music21
+        symbol = _COMMON_CHORDS.get((pc_mask, bass_pc))
+        if symbol is not None:
+            return symbol, 0.98, "lookup"
+
+        try:
+            m21_chord = _m21chord.Chord(midi_notes)
+            symbol = _chordSymbolFigureFromChord(m21_chord)
+            if symbol:
+                # Normalize power chord notation (Cpower → C5)
+                if symbol.endswith("power"):
+                    symbol = symbol.replace("power", "5")
+
+                return sys.intern(symbol), 0.95, "music21"
+        except Exception:
+            # Fall through to heuristic method
+            pass
+
+        return self._analyze_heuristic(midi_notes, pc_mask, bass_pc, unique_count)
+
+    def _analyze_heuristic(
+        self, midi_notes: List[int], pc_mask: int, bass_pc: int, unique_count: int
+    ) -> Tuple[str, float, str]:
+        """
+        Resolve chord name, confidence and method using heuristics only.
+
+        Bound as ``_analyze_fingerprint`` when music21 is unavailable, and
+        used as the fallback when music21 can't name a chord.
+        """
         chord_name = self._heuristic_chord_name(midi_notes)
-        confidence = self._estimate_confidence(midi_notes, chord_name)
+        confidence = self._estimate_confidence(unique_count, chord_name)
 
-        return {
-            "chord_name": chord_name,
-            "notes": self.midi_to_note_names(midi_notes),
-            "midi_notes": sorted(midi_notes),
-            "note_count": len(midi_notes),
-            "confidence": confidence,
-            "method": "heuristic",
-        }
+        return chord_name, confidence, "heuristic"
 
     def _heuristic_chord_name(self, midi_notes: List[int]) -> str:
         """
@@ -129,105 +395,72 @@ class ChordAnalyzer:
         Recognizes common chord types: major, minor, diminished, augmented,
         sevenths, ninths, and various extensions.
         """
-        notes = sorted(list(set(midi_notes)))
+        bass = min(midi_notes)
 
-        if len(notes) == 1:
-            root_note = notes[0] % 12
-            return self.NOTE_NAMES[root_note]
+        # Pitch classes relative to the root, bit 0 = root
+        pc_mask = 0
+        for note in midi_notes:
+            pc_mask |= 1 << ((note - bass) % 12)
 
-        # Get root (lowest note)
-        root_note = notes[0] % 12
-        root_name = self.NOTE_NAMES[root_note]
+        return self._heuristic_name(pc_mask, bass % 12, len(set(midi_notes)))
 
-        if len(notes) == 2:
-            interval = (notes[1] - notes[0]) % 12
-            if interval == 7:
-                return f"{root_name}5"  # Power chord
-            else:
-                return f"{root_name}2"  # Generic dyad
-
-        # Analyze intervals from root
-        intervals = sorted(list(set([(note - notes[0]) % 12 for note in notes[1:]])))
-
-        # Interval detection
-        has_maj3 = 4 in intervals
-        has_min3 = 3 in intervals
-        has_p5 = 7 in intervals
-        has_dim5 = 6 in intervals
-        has_aug5 = 8 in intervals
-        has_min7 = 10 in intervals
-        has_maj7 = 11 in intervals
-        has_9 = 2 in intervals
-        has_11 = 5 in intervals
-        has_13 = 9 in intervals
-
-        # Build chord name
-        chord_name = root_name
-
-        # Determine basic quality
-        if has_min3 and has_dim5:
-            chord_name += "dim"
-        elif has_min3:
-            chord_name += "m"
-        elif has_maj3 and has_aug5:
-            chord_name += "aug"
-        elif has_maj3 and has_p5:
-            pass  # Major, no modifier
-        elif has_maj3 and has_dim5:
-            chord_name += "7"  # Dominant with tritone
-        elif not has_maj3 and not has_min3:
-            # Sus chords
-            if has_11:
-                chord_name += "sus4"
-            elif has_9:
-                chord_name += "sus2"
-
-        # Add 7th extensions
-        if has_maj7:
-            if "m" in chord_name:
-                chord_name += "maj7"
-            else:
-                chord_name += "maj7"
-        elif has_min7:
-            chord_name += "7"
-
-        # Add upper extensions
-        extensions = []
-        if has_13:
-            extensions.append("13")
-        elif has_11:
-            extensions.append("11")
-        elif has_9:
-            extensions.append("9")
+    def _heuristic_name(self, pc_mask: int, bass_pc: int, note_count: int) -> str:
+        """
+        Name a chord from its heuristic fingerprint.
 
-        if extensions:
-            if chord_name.endswith("7") and not chord_name.endswith("maj7"):
-                chord_name = chord_name[:-1]
-            chord_name += extensions[0]
+        Names are interned, so repeated chords share one string object.
 
-        # Handle very complex chords
-        if len(intervals) > 5:
-            return f"{chord_name}({len(notes)})"
+        Args:
+            pc_mask: Pitch-class mask relative to the root (bit 0 = root)
+            bass_pc: Pitch class of the lowest note, taken as the root
+            note_count: Number of unique MIDI notes
+        """
+        # Get root (lowest note)
+        root_name = self.NOTE_NAMES[bass_pc]
 
-        return chord_name
+        if note_count == 1:
+            return root_name
 
-    def _estimate_confidence(self, midi_notes: List[int], chord_name: str) -> float:
+        if note_count == 2:
+            if pc_mask == 0b10000001:
+                return sys.intern(f"{root_name}5")  # Power chord
+            else:
+                return sys.intern(f"{root_name}2")  # Generic dyad
+
+        return sys.intern(_HEURISTIC_TABLE[pc_mask].format(R=root_name, N=note_count))
+
+    def _estimate_confidence(self, unique_count: int, chord_name: str) -> float:
         """
         Estimate confidence in chord recognition.
 
         Uses heuristics like note count, recognized intervals, and chord complexity.
         """
-        note_count = len(set(midi_notes))
-
         # Simple chords = higher confidence
-        if note_count <= 3:
-            return 0.85
-        elif note_count == 4:
-            return 0.80
-        elif note_count <= 6:
-            return 0.70
-        else:
-            return 0.60
+        return _CONFIDENCE_BY_NOTE_COUNT[min(unique_count, 7)]
+
+
+def _note_name(midi_note: int) -> str:
+    """Format a MIDI note number as a note name with octave (e.g. "C4")."""
+    octave = (midi_note // 12) - 1  # MIDI octave calculation
+    return f"{ChordAnalyzer.NOTE_NAMES[midi_note % 12]}{octave}"
+
+
+# Note names with octaves for every MIDI note number (MIDI octave -1 to 9)
+_MIDI_NOTE_NAMES = [_note_name(midi_note) for midi_note in range(128)]
+_MIDI_NOTE_NAME_ARR = np.array(_MIDI_NOTE_NAMES) if np is not None else None
+
+
+# Shared analyzers used by the convenience functions, one per use_music21 flag
+_DEFAULT_ANALYZERS: Dict[bool, ChordAnalyzer] = {}
+
+
+def _get_analyzer(use_music21: bool = True) -> ChordAnalyzer:
+    """Return the shared ChordAnalyzer for the given music21 setting."""
+    analyzer = _DEFAULT_ANALYZERS.get(use_music21)
+    if analyzer is None:
+        analyzer = ChordAnalyzer(use_music21=use_music21)
+        _DEFAULT_ANALYZERS[use_music21] = analyzer
+    return analyzer
 
 
 # Convenience functions
@@ -242,12 +475,10 @@ def midi_to_chord_name(midi_notes: List[int], use_music21: bool = True) -> str:
     Returns:
         Chord name string (e.g. "Cmaj7")
     """
-    analyzer = ChordAnalyzer(use_music21=use_music21)
-    result = analyzer.analyze_chord(midi_notes)
-    return result["chord_name"]
+    return _get_analyzer(use_music21).analyze_chord(midi_notes).chord_name
 
 
-def analyze_chord(midi_notes: List[int]) -> Dict[str, Any]:
+def analyze_chord(midi_notes: List[int]) -> ChordResult:
     """
     Analyze chord with full details.
 
@@ -255,7 +486,6 @@ def analyze_chord(midi_notes: List[int]) -> Dict[str, Any]:
         midi_notes: List of MIDI note numbers
 
     Returns:
-        Full chord analysis dictionary
+        Full chord analysis result
     """
-    analyzer = ChordAnalyzer(use_music21=True)
-    return analyzer.analyze_chord(midi_notes)
+    return _get_analyzer(True).analyze_chord(midi_notes)
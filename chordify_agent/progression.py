@@ -2,21 +2,116 @@
 Chord progression analysis and pattern detection.
 """
 
-from typing import List, Dict, Any, Tuple
-from .analyzer import ChordAnalyzer
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from .analyzer import ChordAnalyzer, ChordResult, _get_analyzer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch analysis falls back to per-chord
+    np = None
+
+# Batch fingerprint kernel, imported by _load_heuristic_jit() on first use
+_heuristic_fingerprints = None
+
+
+def _load_heuristic_jit():
+    """Import the batch fingerprint kernel on first call, or None without NumPy."""
+    global _heuristic_fingerprints
+
+    # Deferred so that importing the package does not load Numba
+    if _heuristic_fingerprints is None and np is not None:
+        from ._heuristic_jit import heuristic_fingerprints
+
+        _heuristic_fingerprints = heuristic_fingerprints
+
+    return _heuristic_fingerprints
+
+# Progressions longer than this use the compiled heuristic in batch analysis
+_BATCH_THRESHOLD = 32
+
+# Progressions longer than this are split across worker processes when
+# max_workers is set, in chunks of _PARALLEL_CHUNKSIZE chords
+_PARALLEL_THRESHOLD = 64
+_PARALLEL_CHUNKSIZE = 256
+
+# Chord quality flags used by pattern detection
+_MINOR = 1
+_SEVENTH = 2
+_EXTENDED = 4
+_DIMINISHED = 8
+_AUGMENTED = 16
+_SUSPENDED = 32
+_MAJOR = 64  # Only used to rule out minor ("Cmaj7" is not a minor chord)
+
+# Quality tokens in chord names. "maj" and "dim" are matched before their
+# embedded "m"; "dim" still counts as minor, as any name containing "m" does.
+_QUALITY_RE = re.compile(r"maj|dim|m|7|9|11|13|aug|sus")
+_TOKEN_FLAGS = {
+    "maj": _MAJOR,
+    "dim": _DIMINISHED | _MINOR,
+    "m": _MINOR,
+    "7": _SEVENTH,
+    "9": _EXTENDED,
+    "11": _EXTENDED,
+    "13": _EXTENDED,
+    "aug": _AUGMENTED,
+    "sus": _SUSPENDED,
+}
+
+_QUALITY_PATTERNS = [
+    (_MINOR, "Contains minor chords"),
+    (_SEVENTH, "Contains seventh chords"),
+    (_EXTENDED, "Contains extended chords"),
+    (_DIMINISHED, "Contains diminished chords"),
+    (_AUGMENTED, "Contains augmented chords"),
+    (_SUSPENDED, "Contains suspended chords"),
+]
+
+# Chord root at the start of a name, e.g. "C#" in "C#m7" or "E-" in "E-maj7"
+_ROOT_RE = re.compile(r"([A-G])([#b-]?)")
+_LETTER_PCS = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+# Root pitch classes of I-IV-V in all 12 keys
+_I_IV_V_ROOTS = {(i, (i + 5) % 12, (i + 7) % 12) for i in range(12)}
+
+
+def _root_pitch_class(chord_name: str) -> Optional[int]:
+    """Return the pitch class of a chord name's root, or None if it has none."""
+    match = _ROOT_RE.match(chord_name)
+    if match is None:
+        return None
+
+    letter, accidental = match.groups()
+    pitch_class = _LETTER_PCS[letter]
+    if accidental == "#":
+        pitch_class += 1
+    elif accidental:
+        pitch_class -= 1  # "b" or music21's "-"
+    return pitch_class % 12
 
 
 class ChordProgression:
     """Analyze sequences of chords for patterns and complexity."""
 
-    def __init__(self, analyzer: ChordAnalyzer = None):
+    __slots__ = ("analyzer", "max_workers")
+
+    def __init__(
+        self, analyzer: ChordAnalyzer = None, max_workers: Optional[int] = None
+    ):
         """
         Initialize progression analyzer.
 
         Args:
-            analyzer: ChordAnalyzer instance (creates new if None)
+            analyzer: ChordAnalyzer instance (uses the shared default if None)
+            max_workers: Number of worker processes for long progressions.
+                        Only used with heuristic-only analyzers, since each
+                        worker would otherwise import music21. None (the
+                        default) analyzes every chord in this process.
         """
-        self.analyzer = analyzer or ChordAnalyzer(use_music21=True)
+        self.analyzer = analyzer or _get_analyzer(True)
+        self.max_workers = max_workers
 
     def analyze_progression(
         self, midi_chord_sequence: List[List[int]]
@@ -37,7 +132,7 @@ class ChordProgression:
                 "complexity_score": int (0-10),
                 "average_notes_per_chord": float,
                 "patterns": List[str],
-                "chord_details": List[Dict]  # Full analysis for each chord
+                "chord_details": List[ChordResult]  # Analysis of each chord
             }
         """
         if not midi_chord_sequence:
@@ -51,19 +146,119 @@ class ChordProgression:
                 "chord_details": [],
             }
 
-        # Analyze each chord
+        if (
+            self.max_workers
+            and len(midi_chord_sequence) > _PARALLEL_THRESHOLD
+            and not self.analyzer._music21_available
+        ):
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                return self._summarize(
+                    executor.map(
+                        self.analyzer.analyze_chord,
+                        midi_chord_sequence,
+                        chunksize=_PARALLEL_CHUNKSIZE,
+                    )
+                )
+
+        return self._summarize(
+            self.analyzer.analyze_chord(midi_notes)
+            for midi_notes in midi_chord_sequence
+        )
+
+    def analyze_progression_batch(self, chord_array: "np.ndarray") -> Dict[str, Any]:
+        """
+        Analyze a progression given as a padded 2-D array of MIDI notes.
+
+        With a heuristic-only analyzer, long progressions are fingerprinted
+        in one compiled pass (Numba if installed) and named from the
+        precomputed heuristic table. Otherwise each row is analyzed as in
+        ``analyze_progression``.
+
+        Args:
+            chord_array: Array of shape (num_chords, max_notes), one chord per
+                         row, padded with -1. All-padding rows are rests.
+
+        Returns:
+            Progression analysis dictionary, as from ``analyze_progression``
+
+        Raises:
+            ValueError: If chord_array is not 2-D or holds notes above 127
+        """
+        if np is not None:
+            chord_array = np.asarray(chord_array)
+            if chord_array.ndim != 2:
+                raise ValueError("chord_array must be 2-D (num_chords, max_notes)")
+            if chord_array.size and chord_array.max() > 127:
+                raise ValueError("chord_array notes must be MIDI numbers (0-127)")
+
+        if (
+            np is None
+            or self.analyzer._music21_available
+            or len(chord_array) <= _BATCH_THRESHOLD
+        ):
+            return self.analyze_progression(
+                [[int(note) for note in row if note >= 0] for row in chord_array]
+            )
+
+        # MIDI numbers fit a signed byte; clamping keeps all padding at -1.
+        # Sorting each row puts the padding first and the notes in order.
+        chord_array = np.sort(np.maximum(chord_array, -1).astype(np.int8), axis=1)
+        fingerprints = _load_heuristic_jit()(chord_array).tolist()
+        padding = (chord_array < 0).sum(axis=1).tolist()
+        names: Dict[int, Tuple[str, float]] = {}
+        return self._summarize(
+            self._analysis_from_fingerprint(row[pad:], fingerprint, names)
+            for row, pad, fingerprint in zip(
+                chord_array.tolist(), padding, fingerprints
+            )
+        )
+
+    def _analysis_from_fingerprint(
+        self,
+        sorted_notes: List[int],
+        fingerprint: int,
+        names: Dict[int, Tuple[str, float]],
+    ) -> ChordResult:
+        """
+        Build a chord analysis from a chord's sorted notes and batch fingerprint.
+
+        ``names`` caches the chord name and confidence for each fingerprint
+        seen so far in the batch.
+        """
+        if not fingerprint:
+            return self.analyzer.analyze_chord([])
+
+        named = names.get(fingerprint)
+        if named is None:
+            note_count = fingerprint >> 16
+            chord_name = self.analyzer._heuristic_name(
+                fingerprint & 0xFFF, (fingerprint >> 12) & 0xF, note_count
+            )
+            named = names[fingerprint] = (
+                chord_name,
+                self.analyzer._estimate_confidence(note_count, chord_name),
+            )
+
+        return self.analyzer._make_result(
+            sorted_notes, named[0], named[1], "heuristic"
+        )
+
+    def _summarize(self, analyses: Iterable[ChordResult]) -> Dict[str, Any]:
+        """Collect chord analyses into the progression analysis dictionary."""
+        # Analyze each chord, gathering statistics along the way
         chord_details = []
         chord_names = []
+        unique_names = set()
+        total_notes = 0
 
-        for midi_notes in midi_chord_sequence:
-            analysis = self.analyzer.analyze_chord(midi_notes)
+        for analysis in analyses:
             chord_details.append(analysis)
-            chord_names.append(analysis["chord_name"])
+            chord_names.append(analysis.chord_name)
+            unique_names.add(analysis.chord_name)
+            total_notes += analysis.note_count
 
-        # Calculate statistics
-        note_counts = [detail["note_count"] for detail in chord_details]
-        avg_notes = sum(note_counts) / len(note_counts) if note_counts else 0
-        unique_chords = len(set(chord_names))
+        avg_notes = total_notes / len(chord_details)
+        unique_chords = len(unique_names)
 
         # Complexity score (0-10)
         complexity_score = min(int(unique_chords * 1.5 + avg_notes), 10)
@@ -72,7 +267,7 @@ class ChordProgression:
         patterns = self._detect_patterns(chord_names)
 
         return {
-            "chord_count": len(midi_chord_sequence),
+            "chord_count": len(chord_details),
             "unique_chords": unique_chords,
             "chord_names": chord_names,
             "complexity_score": complexity_score,
@@ -100,33 +295,25 @@ class ChordProgression:
         if chord_names[0] == chord_names[-1]:
             patterns.append("Returns to root")
 
-        # Minor chords
-        if any("m" in name and "maj" not in name for name in chord_names):
-            patterns.append("Contains minor chords")
-
-        # Seventh chords
-        if any("7" in name for name in chord_names):
-            patterns.append("Contains seventh chords")
-
-        # Extensions (9th, 11th, 13th)
-        if any(ext in name for name in chord_names for ext in ["9", "11", "13"]):
-            patterns.append("Contains extended chords")
-
-        # Diminished chords
-        if any("dim" in name for name in chord_names):
-            patterns.append("Contains diminished chords")
-
-        # Augmented chords
-        if any("aug" in name for name in chord_names):
-            patterns.append("Contains augmented chords")
+        # Chord qualities, collected in a single pass over the names
+        flags = 0
+        for name in chord_names:
+            found = 0
+            for token in _QUALITY_RE.findall(name):
+                found |= _TOKEN_FLAGS[token]
+            if found & _MAJOR:
+                found &= ~_MINOR
+            flags |= found
 
-        # Suspended chords
-        if any("sus" in name for name in chord_names):
-            patterns.append("Contains suspended chords")
+        for flag, pattern in _QUALITY_PATTERNS:
+            if flags & flag:
+                patterns.append(pattern)
 
-        # Common progressions (basic detection)
-        chord_str = " ".join(chord_names[:4])
-        if any(pattern in chord_str for pattern in ["C F G", "D G A"]):
+        # Common progressions: I-IV-V roots on consecutive chords, any key
+        roots = [_root_pitch_class(name) for name in chord_names]
+        if any(
+            window in _I_IV_V_ROOTS for window in zip(roots, roots[1:], roots[2:])
+        ):
             patterns.append("Contains I-IV-V pattern")
 
         return patterns
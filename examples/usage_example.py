@@ -13,19 +13,19 @@ print("\n1️⃣  Analyze C Major Triad")
 print("-" * 50)
 c_major = [60, 64, 67]  # C, E, G
 result = analyzer.analyze_chord(c_major)
-print(f"Chord name: {result['chord_name']}")
-print(f"Notes: {result['notes']}")
-print(f"Confidence: {result['confidence']:.2%}")
-print(f"Method: {result['method']}")
+print(f"Chord name: {result.chord_name}")
+print(f"Notes: {result.notes}")
+print(f"Confidence: {result.confidence:.2%}")
+print(f"Method: {result.method}")
 
 # Example 2: Analyze G7 chord
 print("\n2️⃣  Analyze G7 (Dominant Seventh)")
 print("-" * 50)
 g7 = [67, 71, 74, 77]  # G, B, D, F
 result = analyzer.analyze_chord(g7)
-print(f"Chord name: {result['chord_name']}")
-print(f"Notes: {result['notes']}")
-print(f"Note count: {result['note_count']}")
+print(f"Chord name: {result.chord_name}")
+print(f"Notes: {result.notes}")
+print(f"Note count: {result.note_count}")
 
 # Example 3: Analyze a progression
 print("\n3️⃣  Analyze Chord Progression (I-IV-V-I in C)")
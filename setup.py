@@ -34,5 +34,7 @@ setup(
     ],
     extras_require={
         "dev": ["pytest>=6.0", "black", "flake8"],
+        "numpy": ["numpy>=1.17"],
+        "numba": ["numpy>=1.17", "numba"],
     },
 )
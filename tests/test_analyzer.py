@@ -1,5 +1,7 @@
 """Test chord analyzer functionality."""
 
+import pytest
+
 from chordify_agent import ChordAnalyzer, midi_to_chord_name, analyze_chord
 
 
@@ -7,53 +9,96 @@ def test_major_triad():
     """Test C major chord recognition."""
     # C major: C-E-G (MIDI: 60, 64, 67)
     result = analyze_chord([60, 64, 67])
-    print(f"✓ C major: {result['chord_name']}")
-    assert result["chord_name"] in ["C", "Cmaj"],  f"Expected C/Cmaj, got {result['chord_name']}"
-    assert result["note_count"] == 3
+    print(f"✓ C major: {result.chord_name}")
+    assert result.chord_name in ["C", "Cmaj"],  f"Expected C/Cmaj, got {result.chord_name}"
+    assert result.note_count == 3
 
 
 def test_minor_triad():
     """Test A minor chord recognition."""
     # A minor: A-C-E (MIDI: 69, 72, 76)
     result = analyze_chord([69, 72, 76])
-    print(f"✓ A minor: {result['chord_name']}")
-    assert "m" in result["chord_name"] or result["chord_name"] == "Am"
-    assert result["note_count"] == 3
+    print(f"✓ A minor: {result.chord_name}")
+    assert "m" in result.chord_name or result.chord_name == "Am"
+    assert result.note_count == 3
 
 
 def test_seventh_chord():
     """Test G7 chord recognition."""
     # G7: G-B-D-F (MIDI: 67, 71, 74, 77)
     result = analyze_chord([67, 71, 74, 77])
-    print(f"✓ G7: {result['chord_name']}")
-    assert "7" in result["chord_name"]
-    assert result["note_count"] == 4
+    print(f"✓ G7: {result.chord_name}")
+    assert "7" in result.chord_name
+    assert result.note_count == 4
 
 
 def test_power_chord():
     """Test power chord (root + fifth)."""
     # C5: C-G (MIDI: 60, 67)
     result = analyze_chord([60, 67])
-    print(f"✓ C5 (power): {result['chord_name']}")
-    assert result["chord_name"] in ["C5", "C2"]
-    assert result["note_count"] == 2
+    print(f"✓ C5 (power): {result.chord_name}")
+    assert result.chord_name in ["C5", "C2"]
+    assert result.note_count == 2
 
 
 def test_diminished():
     """Test diminished chord."""
     # Bdim: B-D-F (MIDI: 71, 74, 77)
     result = analyze_chord([71, 74, 77])
-    print(f"✓ B diminished: {result['chord_name']}")
-    assert result["note_count"] == 3
+    print(f"✓ B diminished: {result.chord_name}")
+    assert result.note_count == 3
+
+
+def test_common_chord_lookup():
+    """Test that root-position triads and sevenths skip music21."""
+    pytest.importorskip("music21")
+    analyzer = ChordAnalyzer(use_music21=True)
+    result = analyzer.analyze_chord([63, 67, 70, 74])
+    print(f"✓ E- major 7: {result.chord_name}")
+    assert result.chord_name == "E-maj7"
+    assert result.method == "lookup"
+    # Inversions still go through music21
+    assert analyzer.analyze_chord([64, 67, 72]).method == "music21"
+
+
+def test_music21_voicings_not_shared():
+    """Test that voicings with the same fingerprint keep their music21 names."""
+    pytest.importorskip("music21")
+    from music21 import chord
+    from music21.harmony import chordSymbolFigureFromChord
+
+    analyzer = ChordAnalyzer(use_music21=True)
+    for midi_notes in ([65, 68, 69, 72], [65, 69, 72, 80]):
+        expected = chordSymbolFigureFromChord(chord.Chord(midi_notes))
+        result = analyzer.analyze_chord(midi_notes)
+        print(f"✓ {midi_notes}: {result.chord_name}")
+        assert result.chord_name == expected
+        assert result.method == "music21"
 
 
 def test_rest():
     """Test empty chord (rest)."""
     result = analyze_chord([])
-    print(f"✓ Rest: {result['chord_name']}")
-    assert result["chord_name"] == "Rest"
-    assert result["note_count"] == 0
-    assert result["confidence"] == 1.0
+    print(f"✓ Rest: {result.chord_name}")
+    assert result.chord_name == "Rest"
+    assert result.note_count == 0
+    assert result.confidence == 1.0
+
+
+def test_result_dict_access():
+    """Test that results still support dictionary-style access."""
+    result = analyze_chord([60, 64, 67])
+    print(f"✓ Dict access: {result['chord_name']}")
+    assert result["chord_name"] == result.chord_name
+    assert result.as_dict()["midi_notes"] == [60, 64, 67]
+    with pytest.raises(KeyError):
+        result["root"]
+
+    assert "chord_name" in result and "root" not in result
+    assert list(result.keys())[0] == "chord_name"
+    assert dict(result.items()) == result.as_dict()
+    assert result.get("method") == result.method
+    assert result.get("root", "n/a") == "n/a"
 
 
 def test_note_names():
@@ -62,6 +107,19 @@ def test_note_names():
     notes = analyzer.midi_to_note_names([60, 64, 67])
     print(f"✓ Note names: {notes}")
     assert notes == ["C4", "E4", "G4"]
+    # Outside the MIDI range names are still formatted, not looked up
+    assert analyzer.midi_to_note_names([-1, 128]) == ["B-2", "G#9"]
+
+
+def test_note_names_batch():
+    """Test batch MIDI to note name conversion."""
+    np = pytest.importorskip("numpy")
+    analyzer = ChordAnalyzer()
+    notes = analyzer.midi_to_note_names_batch(np.array([[60, 64, 67], [21, 0, 127]]))
+    print(f"✓ Batch note names: {notes.tolist()}")
+    assert notes.tolist() == [["C4", "E4", "G4"], ["A0", "C-1", "G9"]]
+    with pytest.raises(ValueError):
+        analyzer.midi_to_note_names_batch(np.array([-1, 60]))
 
 
 def test_quick_functions():
@@ -71,6 +129,17 @@ def test_quick_functions():
     assert name in ["C", "Cmaj"]
 
 
+def test_repeated_chord_voicings():
+    """Test that revoiced chords share an analysis but keep their own notes."""
+    analyzer = ChordAnalyzer(use_music21=False)
+    first = analyzer.analyze_chord([60, 64, 67])
+    revoiced = analyzer.analyze_chord([48, 64, 67, 72])
+    print(f"✓ Revoiced C major: {revoiced.chord_name}")
+    assert revoiced.chord_name == first.chord_name
+    assert revoiced.midi_notes == [48, 64, 67, 72]
+    assert revoiced.notes == ["C3", "E4", "G4", "C5"]
+
+
 if __name__ == "__main__":
     print("\n🧪 Testing chordify-agent chord analyzer...\n")
 
@@ -79,8 +148,13 @@ if __name__ == "__main__":
     test_seventh_chord()
     test_power_chord()
     test_diminished()
+    test_common_chord_lookup()
+    test_music21_voicings_not_shared()
     test_rest()
+    test_result_dict_access()
     test_note_names()
+    test_note_names_batch()
     test_quick_functions()
+    test_repeated_chord_voicings()
 
     print("\n✅ All tests passed!\n")
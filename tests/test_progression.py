@@ -0,0 +1,135 @@
+"""Test chord progression analysis."""
+
+import json
+
+import pytest
+
+from chordify_agent import ChordAnalyzer, ChordProgression
+
+
+def test_progression_statistics():
+    """Test chord counts and averages for a I-IV-V-I progression."""
+    progression = ChordProgression()
+    result = progression.analyze_progression(
+        [[60, 64, 67], [65, 69, 72], [67, 71, 74, 77], [60, 64, 67]]
+    )
+    print(f"✓ Progression: {result['chord_names']}")
+    assert result["chord_count"] == 4
+    assert result["unique_chords"] == 3
+    assert result["average_notes_per_chord"] == 3.2
+    assert len(result["chord_details"]) == 4
+
+
+def test_progression_json_serializable():
+    """Test that progression results can be serialized to JSON."""
+    progression = ChordProgression()
+    result = progression.analyze_progression([[60, 64, 67], [65, 69, 72], []])
+    data = json.loads(json.dumps(result))
+    print(f"✓ JSON chord details: {data['chord_details'][0]}")
+    assert data["chord_names"] == result["chord_names"]
+    assert data["chord_details"] == [list(detail) for detail in result["chord_details"]]
+
+
+def test_batch_matches_per_chord():
+    """Test that batch analysis of a padded array matches per-chord analysis."""
+    np = pytest.importorskip("numpy")
+    progression = ChordProgression(ChordAnalyzer(use_music21=False))
+    chords = [[60, 64, 67], [57, 60, 64, 67], [], [43, 55, 62, 65, 69]] * 10
+    padded = np.full((len(chords), 5), -1)
+    for i, chord in enumerate(chords):
+        padded[i, : len(chord)] = chord
+
+    result = progression.analyze_progression_batch(padded)
+    print(f"✓ Batch progression: {result['chord_names'][:4]}")
+    assert result == progression.analyze_progression(chords)
+
+
+def test_batch_rejects_invalid_arrays():
+    """Test that batch analysis rejects non-MIDI notes and non-2-D arrays."""
+    np = pytest.importorskip("numpy")
+    progression = ChordProgression(ChordAnalyzer(use_music21=False))
+    out_of_range = np.full((40, 3), -1)
+    out_of_range[0] = [60, 200, 3000]
+
+    with pytest.raises(ValueError):
+        progression.analyze_progression_batch(out_of_range)
+    with pytest.raises(ValueError):
+        progression.analyze_progression_batch(np.array([60, 64, 67]))
+
+
+def test_uncompiled_fingerprints_int8():
+    """Test the plain-Python fingerprint kernel on int8 arrays (no Numba)."""
+    np = pytest.importorskip("numpy")
+    from chordify_agent._heuristic_jit import heuristic_fingerprints
+
+    kernel = getattr(heuristic_fingerprints, "py_func", heuristic_fingerprints)
+    chords = np.array(
+        [[60, 64, 67, -1], [-1, -1, -1, -1], [127, 0, 6, 6]], dtype=np.int8
+    )
+    fingerprints = kernel(chords).tolist()
+    print(f"✓ Uncompiled fingerprints: {fingerprints}")
+    assert fingerprints == [
+        (1 << 0 | 1 << 4 | 1 << 7) | (0 << 12) | (3 << 16),
+        0,
+        (1 << 0 | 1 << 6 | 1 << 7) | (0 << 12) | (3 << 16),
+    ]
+
+
+def test_parallel_matches_serial():
+    """Test that worker-process analysis matches serial analysis."""
+    chords = [[60, 64, 67], [65, 69, 72, 76], [67, 71, 74, 77], [], [62, 69]] * 20
+    serial = ChordProgression(ChordAnalyzer(use_music21=False))
+    parallel = ChordProgression(ChordAnalyzer(use_music21=False), max_workers=2)
+
+    result = parallel.analyze_progression(chords)
+    print(f"✓ Parallel progression: {result['chord_count']} chords")
+    assert result == serial.analyze_progression(chords)
+
+
+def test_detect_quality_patterns():
+    """Test chord quality pattern detection."""
+    progression = ChordProgression()
+    patterns = progression._detect_patterns(["C", "Am7", "Bdim", "Gsus4", "C"])
+    print(f"✓ Quality patterns: {patterns}")
+    assert patterns == [
+        "Returns to root",
+        "Contains minor chords",
+        "Contains seventh chords",
+        "Contains diminished chords",
+        "Contains suspended chords",
+    ]
+
+
+def test_major_seventh_not_minor():
+    """Test that maj7 chords are not reported as minor."""
+    progression = ChordProgression()
+    patterns = progression._detect_patterns(["Cmaj7", "Fmaj9"])
+    print(f"✓ Major seventh patterns: {patterns}")
+    assert "Contains minor chords" not in patterns
+    assert "Contains extended chords" in patterns
+
+
+def test_i_iv_v_any_key():
+    """Test I-IV-V detection on chord roots in any key and spelling."""
+    progression = ChordProgression()
+    patterns = progression._detect_patterns(["Am", "E-", "A-", "B-7", "E-"])
+    print(f"✓ I-IV-V in E-: {patterns}")
+    assert "Contains I-IV-V pattern" in patterns
+    patterns = progression._detect_patterns(["C", "G", "F", "C"])
+    assert "Contains I-IV-V pattern" not in patterns
+
+
+if __name__ == "__main__":
+    print("\n🧪 Testing chordify-agent progression analysis...\n")
+
+    test_progression_statistics()
+    test_progression_json_serializable()
+    test_batch_matches_per_chord()
+    test_batch_rejects_invalid_arrays()
+    test_uncompiled_fingerprints_int8()
+    test_parallel_matches_serial()
+    test_detect_quality_patterns()
+    test_major_seventh_not_minor()
+    test_i_iv_v_any_key()
+
+    print("\n✅ All tests passed!\n")